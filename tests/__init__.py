@@ -9,4 +9,9 @@ This test suite provides Python-based integration testing for:
 - End-to-end policy evaluation workflows
 """
 
+from pathlib import Path
+
 __version__ = "0.1.0"
+
+# Project root, resolved once for every test module
+BASE_DIR = Path(__file__).resolve().parent.parent
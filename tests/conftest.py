@@ -2,18 +2,60 @@
 Pytest configuration and shared fixtures for PolicyEngine tests.
 """
 
+import functools
+import hashlib
+import itertools
 import os
+import socket
 import subprocess
-import time
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator, Optional
 
+import orjson
 import pytest
+import requests
+import urllib3.connection
+from filelock import FileLock
+from requests.adapters import HTTPAdapter
+
+from tests.utils import allure_helpers
+from tests.utils.mpe_runner import MpeServerPool
 
 
 # Project root directory
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# PORC payloads shared by the example tests
+PAYLOAD_DIR = PROJECT_ROOT / "tests" / "test_data" / "api" / "payloads" / "porc_json"
+
+# PolicyDomain served by mpe_server unless a test selects another bundle
+DEFAULT_BUNDLE = PROJECT_ROOT / "tests" / "test_data" / "api" / "payloads" / "yml" / "consolidated.yml"
+
+
+# CI runs with `-p no:cacheprovider` because nothing reuses .pytest_cache on an
+# ephemeral runner; local runs keep the cache, which --use-cache and --lf need.
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--use-cache",
+        action="store_true",
+        default=False,
+        help="Skip negative bundle tests whose bundle is unchanged since their last green run",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Enable Allure attachments only when a results directory is configured."""
+    allure_helpers.ALLURE_ACTIVE = bool(config.getoption("allure_report_dir", default=None))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    """Attach a test's deferred Allure attachments only when its call phase failed."""
+    outcome = yield
+    report = outcome.get_result()
+    if report.when == "call":
+        allure_helpers.flush_attachments(report.failed)
+
 
 @pytest.fixture(scope="session")
 def project_root() -> Path:
@@ -27,28 +69,90 @@ def testdata_dir(project_root: Path) -> Path:
     return project_root / "testdata"
 
 
+def _mtime(path: Path) -> Optional[float]:
+    """Return the modification time of path from a single stat, or None if it is missing."""
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def _mpe_binary_is_stale(binary_path: Path, project_root: Path) -> bool:
+    """
+    Return True if the mpe binary is missing or older than any build input.
+
+    The inputs mirror the Makefile's target/mpe prerequisites, $(GO_FILES) and
+    the Makefile itself, so a binary reported stale is one make will rebuild.
+    """
+    built_at = _mtime(binary_path)
+    if built_at is None:
+        return True
+
+    build_inputs = itertools.chain(project_root.rglob("*.go"), (project_root / "Makefile",))
+    return any((_mtime(path) or 0) > built_at for path in build_inputs)
+
+
 @pytest.fixture(scope="session")
-def mpe_binary(project_root: Path) -> Path:
+def mpe_binary(project_root: Path, tmp_path_factory: pytest.TempPathFactory) -> Path:
     """
     Ensure the mpe binary is built and return its path.
 
-    This fixture builds the PolicyEngine CLI if it doesn't exist.
+    This fixture rebuilds the PolicyEngine CLI only when it is missing or
+    older than the Go sources. The build is serialized through a file lock in
+    the shared pytest temp directory so that xdist workers build it once.
     """
     binary_path = project_root / "target" / "mpe"
+    lock_path = tmp_path_factory.getbasetemp().parent / "mpe-build.lock"
 
-    if not binary_path.exists():
-        print("\n🔨 Building mpe binary...")
-        subprocess.run(
-            ["make", "build"],
-            cwd=project_root,
-            check=True,
-            capture_output=True
-        )
+    with FileLock(str(lock_path)):
+        if _mpe_binary_is_stale(binary_path, project_root):
+            print("\n🔨 Building mpe binary...")
+            try:
+                subprocess.run(
+                    ["make", "build"],
+                    cwd=project_root,
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                )
+            except subprocess.CalledProcessError as e:
+                pytest.fail(f"`make build` failed:\n{e.stderr.decode(errors='replace')}")
 
     assert binary_path.exists(), "Failed to build mpe binary"
     return binary_path
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _warm_mpe(mpe_binary: Path, mpe_version_result: subprocess.CompletedProcess) -> None:
+    """
+    Pay the mpe cold start once, before the first test runs.
+
+    The binary is hinted into the page cache and the session's cached
+    `mpe version` run faults in the loader and runtime, so the first measured
+    test and every server start after it begin warm.
+    """
+    if hasattr(os, "posix_fadvise"):
+        with open(mpe_binary, "rb") as binary:
+            os.posix_fadvise(binary.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+
+
+@pytest.fixture(scope="session")
+def mpe_version_result(mpe_binary: Path) -> subprocess.CompletedProcess:
+    """
+    Return the result of `mpe version`, run once per session.
+
+    The output depends only on the binary, so CLI tests assert against this
+    cached result instead of forking mpe themselves.
+    """
+    return subprocess.run([str(mpe_binary), "version"], capture_output=True, text=True)
+
+
+@pytest.fixture(scope="session")
+def mpe_help_result(mpe_binary: Path) -> subprocess.CompletedProcess:
+    """Return the result of `mpe --help`, run once per session."""
+    return subprocess.run([str(mpe_binary), "--help"], capture_output=True, text=True)
+
+
 @pytest.fixture
 def sample_policy_domain(testdata_dir: Path) -> Path:
     """Return path to a sample PolicyDomain YAML file."""
@@ -58,63 +162,98 @@ def sample_policy_domain(testdata_dir: Path) -> Path:
 
 
 @pytest.fixture(scope="session")
-def mpe_server_port() -> int:
-    """Return the port for the MPE server during tests."""
-    return int(os.getenv("MPE_TEST_PORT", "9090"))
+def all_payloads() -> dict:
+    """
+    Return every PORC JSON payload keyed by file name.
+
+    The payloads are parsed once per session and shared by every example
+    module instead of being re-read for each parametrized case.
+    """
+    return {path.name: orjson.loads(path.read_bytes()) for path in PAYLOAD_DIR.glob("*.json")}
+
+
+@pytest.fixture(scope="session")
+def bundle_hash(mpe_binary: Path) -> Callable[[Path], str]:
+    """
+    Return a function that hashes a bundle's contents together with the mpe binary.
+
+    Each bundle is read and hashed once per session; the digest keys the
+    results of negative tests persisted in the pytest cache. The binary's
+    mtime and size are mixed in so that a rebuilt mpe, which may report
+    compile errors differently, invalidates every stored result.
+    """
+    binary_stat = mpe_binary.stat()
+    binary_id = f"{binary_stat.st_mtime_ns}:{binary_stat.st_size}".encode()
+
+    @functools.lru_cache(maxsize=None)
+    def _bundle_hash(bundle_path: Path) -> str:
+        digest = hashlib.blake2b(binary_id)
+        digest.update(Path(bundle_path).read_bytes())
+        return digest.hexdigest()
+
+    return _bundle_hash
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def mpe_server(
+    request: pytest.FixtureRequest,
     mpe_binary: Path,
-    sample_policy_domain: Path,
-    mpe_server_port: int
-) -> Generator[str, None, None]:
-    """
-    Start a PolicyEngine server for integration tests.
-
-    Yields:
-        Base URL of the running server (e.g., "http://localhost:9090")
-    """
-    server_url = f"http://localhost:{mpe_server_port}"
-
-    # Start the server
-    print(f"\n🚀 Starting MPE server on {server_url}...")
-    process = subprocess.Popen(
-        [
-            str(mpe_binary),
-            "serve",
-            "--bundle", str(sample_policy_domain),
-            "--http-port", str(mpe_server_port),
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        cwd=PROJECT_ROOT
-    )
+    mpe_servers: MpeServerPool
+) -> str:
+    """
+    Return the URL of a shared PolicyEngine server for integration tests.
 
-    # Wait for server to be ready
-    max_attempts = 30
-    for attempt in range(max_attempts):
-        try:
-            import requests
-            response = requests.get(f"{server_url}/health", timeout=1)
-            if response.status_code == 200:
-                print(f"✅ MPE server ready after {attempt + 1} attempts")
-                break
-        except Exception:
-            time.sleep(0.5)
-    else:
-        process.kill()
-        raise RuntimeError("MPE server failed to start within timeout")
-
-    yield server_url
-
-    # Cleanup
-    print("\n🛑 Stopping MPE server...")
-    process.terminate()
-    try:
-        process.wait(timeout=5)
-    except subprocess.TimeoutExpired:
-        process.kill()
+    The consolidated example PolicyDomain is served unless a test selects another bundle
+    through indirect parametrization, e.g.
+    ``@pytest.mark.parametrize("mpe_server", [bundle_path], indirect=True)``.
+    One server is started per bundle and reused for the rest of the session.
+
+    Returns:
+        Base URL of the running server (e.g., "http://127.0.0.1:9090")
+    """
+    bundle_path = getattr(request, "param", DEFAULT_BUNDLE)
+    server = mpe_servers[bundle_path]
+    if server is None:
+        raise RuntimeError(f"MPE server failed to start for {bundle_path}")
+    if server.startup_failure is not None:
+        raise RuntimeError(f"MPE server exited during startup:\n{server.startup_failure.stderr.decode(errors='replace')}")
+
+    print(f"\n🚀 Using MPE server on {server.url} for {bundle_path}")
+    return server.url
+
+
+@pytest.fixture(scope="session")
+def http_session() -> Generator[requests.Session, None, None]:
+    """
+    Return one pooled HTTP session shared by every MPE server in the worker.
+
+    Connections stay open between decisions, so each POST skips the TCP
+    handshake, and Nagle's algorithm is disabled so small request bodies are
+    not held back waiting for delayed ACKs.
+    """
+    nodelay = (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    if nodelay not in urllib3.connection.HTTPConnection.default_socket_options:
+        urllib3.connection.HTTPConnection.default_socket_options += [nodelay]
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount("http://", adapter)
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def mpe_servers(mpe_binary: Path, http_session: requests.Session) -> Generator[MpeServerPool, None, None]:
+    """
+    Return a pool of long-lived MPE servers keyed by bundle path.
+
+    Each bundle is compiled once by its own `mpe serve` process on first
+    lookup, and every parametrized payload for that bundle is then decided
+    over HTTP against the already-loaded policies.
+    """
+    pool = MpeServerPool(session=http_session)
+    yield pool
+    pool.stop_all()
 
 
 @pytest.fixture
@@ -0,0 +1,17 @@
+"""Parametrization data shared by the example bundle tests."""
+
+# PORC payloads from tests/test_data/api/payloads/porc_json run against every bundle
+JSON_TEST_FILES = (
+    "valid_admin.json",
+    "admin_with_write_api_scope.json",
+    "access_denied_when_role_is_null.json",
+    "access_allowed_when_scope_is_null.json",
+    "valid_admin_with_multiple_scopes_allows_access.json",
+    "non_admin_with_read_scope_is_denied_access.json",
+    "access_denied_with_invalid_scope_format.json",
+    "access_denied_with_additional_but_irrelevant_scopes.json",
+    "access_denied_for_unauthorized_http_method_operation.json",
+    "access_allowed_for_authorized_http_method_operation.json",
+)
+
+JSON_TEST_IDS = tuple(filename[:-len(".json")] for filename in JSON_TEST_FILES)
@@ -0,0 +1,156 @@
+import orjson
+import pytest
+import allure
+
+from tests import BASE_DIR
+from tests.mpe.examples._shared import JSON_TEST_FILES, JSON_TEST_IDS
+from tests.utils.mpe_runner import run_mpe_decision, normalize_decision
+from tests.utils.allure_helpers import attach_payload, attach_bundle_yaml, attach_output
+
+# === File locations ===
+YAML_DIR = BASE_DIR / "tests" / "test_data" / "api" / "payloads" / "yml"
+
+# === Expected outcomes ===
+FAILS = "fails"                      # mpe must exit non-zero and report every expected error
+DENIES = "denies"                    # mpe must succeed and return DENY
+DENIES_OR_FAILS = "denies_or_fails"  # either of the above is acceptable
+
+
+def _bundle(bundle_file, expected_errors, expected_outcome, tags=()):
+    """Build one parametrization entry; each bundle is pinned to its own xdist worker group."""
+    bundle_id = bundle_file[:-len(".yml")]
+    return pytest.param(
+        YAML_DIR / bundle_file,
+        tuple(expected_errors),
+        expected_outcome,
+        tags,
+        id=bundle_id,
+        marks=pytest.mark.xdist_group(bundle_id),
+    )
+
+
+# === (bundle_file, expected_errors, expected_outcome) per bundle ===
+BUNDLE_CASES = [
+    _bundle("bad_rego.yml", [
+        "rego compilation failed",
+        "package expected",
+        "var cannot be used for rule name"
+    ], FAILS),
+    _bundle("broken_alpha.yml", [
+        "validation failed",
+        "undefined references",
+        "not found",
+        "cycle"
+    ], FAILS, ("iam", "Policy Engine", "Broken YAML", "Cycle Detection", "broken_alpha")),
+    _bundle("broken_beta.yml", [
+        "validation failed",
+        "undefined references to domain 'alpha'",
+        "undefined references to domain 'gamma'",
+        "role reference 'mrn:iam:role:nonexistent' not found",
+        "policy reference 'mrn:iam:policy:missing' not found",
+        "cycle"
+    ], FAILS, ("iam", "Policy Engine", "Broken YAML", "Reference Errors", "broken_beta")),
+    _bundle("invalid_policy_reference.yml", [
+        "missing-lib",
+        "not found in domain",
+        "invalid-policy",
+        "library reference"
+    ], FAILS, ("iam", "Policy Engine", "Broken YAML", "Invalid Policy Reference", "invalid_policy_reference")),
+    _bundle("malformed_bundle.yml", [
+        "yaml",
+        "expected ':'"
+    ], DENIES, ("iam", "Policy Engine", "Broken YAML", "Malformed YAML", "malformed_bundle")),
+    _bundle("missing_role_reference.yml", [
+        "role",
+        "not found"
+    ], DENIES_OR_FAILS, ("iam", "Policy Engine", "Broken YAML", "Missing Role Reference", "missing_role_reference")),
+    _bundle("mixed_invalid.yml", [
+        "validation failed",
+        "library reference 'mrn:iam:library:missing' not found",
+        "policy reference 'mrn:iam:policy:missing' not found"
+    ], DENIES_OR_FAILS, ("iam", "Policy Engine", "Invalid Domain", "Reference Errors", "mixed_invalid")),
+    _bundle("mixed_valid.yml", [
+        "operation not found",
+        "bundle not found"
+    ], DENIES_OR_FAILS, ("iam", "Policy Engine", "Mixed Bundle", "Access Denied", "Missing References", "Mixed_Valid")),
+    _bundle("multi_error.yml", [
+        "validation failed",
+        "library reference 'mrn:iam:library:missing1' not found",
+        "library reference 'mrn:iam:library:missing2' not found",
+        "undefined references to domain 'other-domain'",
+        "policy reference 'mrn:iam:policy:missing1' not found",
+        "policy reference 'mrn:iam:policy:missing2' not found",
+        "policy reference 'mrn:iam:policy:missing3' not found",
+        "role reference 'mrn:iam:role:missing1' not found",
+        "role reference 'mrn:iam:role:missing2' not found"
+    ], DENIES_OR_FAILS, ("iam", "Policy Engine", "Multi Reference Errors")),
+    _bundle("valid_alpha.yml", [
+        "unexpected phase1 result: true",
+        "bundle not found"
+    ], DENIES_OR_FAILS, ("iam", "Valid Alpha", "Unexpected Rego Result", "Bundle Not Found")),
+]
+
+# Lowercased byte needles, computed once instead of per test
+EXPECTED_ERRORS_B = {
+    case.values[0]: [error.lower().encode() for error in case.values[1]] for case in BUNDLE_CASES
+}
+
+@pytest.fixture(scope="module", autouse=True)
+def _check_bundles():
+    for case in BUNDLE_CASES:
+        bundle_path = case.values[0]
+        assert bundle_path.exists(), f"YAML bundle not found: {bundle_path}"
+
+@pytest.mark.parametrize("filename", JSON_TEST_FILES, ids=JSON_TEST_IDS)
+@pytest.mark.parametrize("bundle_file,expected_errors,expected_outcome,tags", BUNDLE_CASES)
+def test_bundle_with_payload(
+    bundle_file, expected_errors, expected_outcome, tags, filename, all_payloads, mpe_servers, bundle_hash, request
+):
+    payload = all_payloads[filename]
+
+    # A negative bundle fails to compile the same way for unchanged contents,
+    # so a green result is remembered per bundle and mpe binary hash and
+    # replayed with --use-cache.
+    cache = getattr(request.config, "cache", None) if expected_outcome == FAILS else None
+    if cache is not None:
+        cache_key = f"bundle_hashes/{request.node.callspec.id}"
+        digest = bundle_hash(bundle_file)
+        if request.config.getoption("use_cache") and cache.get(cache_key, None) == digest:
+            pytest.skip("bundle unchanged since last green run")
+    if tags:
+        allure.dynamic.tag(*tags)
+
+    # Attach files for Allure
+    attach_payload(payload)
+    attach_bundle_yaml(bundle_file)
+
+    result = run_mpe_decision(payload, bundle_file, allow_error=True, server=mpe_servers[bundle_file])
+    if result.returncode == 0:
+        assert expected_outcome != FAILS, f"Expected MPE to fail for {bundle_file.name}, but it succeeded."
+
+        output = result.stdout
+        attach_output(output)
+
+        try:
+            response = orjson.loads(output)
+        except orjson.JSONDecodeError:
+            pytest.fail("MPE output is not valid JSON")
+
+        decision = normalize_decision(response.get("decision"))
+        assert decision == "DENY", f"Expected decision=DENY (deny), got: {decision}"
+    else:
+        combined_output = result.stdout + b"\n" + result.stderr
+        attach_output(combined_output or "No output captured from mpe command.")
+
+        assert expected_outcome != DENIES, \
+            f"MPE failed for {bundle_file.name}: {result.stderr.decode(errors='replace')}"
+
+        output_lower = combined_output.lower()
+        missing = [
+            error for error, needle in zip(expected_errors, EXPECTED_ERRORS_B[bundle_file])
+            if needle not in output_lower
+        ]
+        assert not missing, f"Expected errors not found in MPE output: {missing}"
+
+        if cache is not None:
+            cache.set(cache_key, digest)
@@ -1,39 +1,30 @@
-import json
+import orjson
 import os
 import pytest
-import allure
-from pathlib import Path
 
+from tests import BASE_DIR
 from tests.utils.mpe_runner import run_mpe_decision, handle_mpe_failure, normalize_decision
-from tests.utils.allure_helpers import attach_payload, attach_bundle_yaml, attach_output
+from tests.utils.allure_helpers import attach_payload, attach_bundle_yaml, attach_output, attach_json
 
-BASE_DIR = Path(__file__).resolve().parents[3]
-
-JSON_PAYLOAD_DIR = BASE_DIR / "tests" / "test_data" / "api" / "payloads" / "porc_json"
 YAML_BUNDLE_FILE = BASE_DIR / "tests" / "test_data" / "api" / "payloads" / "yml" / "consolidated.yml"
 
-def load_payload(filename):
-    filepath = JSON_PAYLOAD_DIR / filename
-    if not filepath.exists():
-        pytest.fail(f"JSON payload file not found: {filepath}")
-    with open(filepath, "r") as f:
-        return json.load(f)
-
-def run_and_validate_policy_test(filename, expected_allow: bool):
-    payload = load_payload(filename)
+# Keep every case on the worker that owns the consolidated server
+pytestmark = pytest.mark.xdist_group("consolidated")
 
-    if not YAML_BUNDLE_FILE.exists():
-        pytest.fail(f"Bundle YAML file not found: {YAML_BUNDLE_FILE}")
+@pytest.fixture(scope="module", autouse=True)
+def _check_bundle():
+    assert YAML_BUNDLE_FILE.exists(), f"Bundle YAML file not found: {YAML_BUNDLE_FILE}"
 
-    result = run_mpe_decision(payload, YAML_BUNDLE_FILE, allow_error=False)
+def run_and_validate_policy_test(payload, expected_allow: bool, server):
+    result = run_mpe_decision(payload, YAML_BUNDLE_FILE, allow_error=False, server=server)
 
     attach_payload(payload)
     attach_bundle_yaml(YAML_BUNDLE_FILE)
     attach_output(result.stdout)
 
     try:
-        response = json.loads(result.stdout)
-    except json.JSONDecodeError:
+        response = orjson.loads(result.stdout)
+    except orjson.JSONDecodeError:
         pytest.fail("Output is not valid JSON")
 
     decision = normalize_decision(response.get("decision"))
@@ -41,7 +32,7 @@ def run_and_validate_policy_test(filename, expected_allow: bool):
 
     deny_refs = [r for r in references if normalize_decision(r.get("decision")) == "DENY"]
     if expected_allow and deny_refs:
-        allure.attach(json.dumps(deny_refs, indent=2), name="Denied References", attachment_type=allure.attachment_type.JSON)
+        attach_json(deny_refs, name="Denied References")
         pytest.fail("Expected allow, but deny references found")
 
     if expected_allow:
@@ -67,5 +58,5 @@ test_cases = [
     test_cases,
     ids=[os.path.splitext(name)[0] for name, _ in test_cases]
 )
-def test_policy_decision(filename, expected_allow):
-    run_and_validate_policy_test(filename, expected_allow)
\ No newline at end of file
+def test_policy_decision(filename, expected_allow, all_payloads, mpe_servers):
+    run_and_validate_policy_test(all_payloads[filename], expected_allow, mpe_servers[YAML_BUNDLE_FILE])
\ No newline at end of file
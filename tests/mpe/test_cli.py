@@ -0,0 +1,14 @@
+import allure
+
+
+@allure.tag("mpe", "CLI")
+def test_mpe_version(mpe_version_result):
+    assert mpe_version_result.returncode == 0, f"`mpe version` failed:\n{mpe_version_result.stderr}"
+    assert mpe_version_result.stdout.strip(), "`mpe version` printed no version"
+
+
+@allure.tag("mpe", "CLI")
+def test_mpe_help(mpe_help_result):
+    assert mpe_help_result.returncode == 0, f"`mpe --help` failed:\n{mpe_help_result.stderr}"
+    assert "A CLI application for working with the Manetu PolicyEngine" in mpe_help_result.stdout
+    assert "version" in mpe_help_result.stdout, "`mpe --help` does not list the version command"
@@ -1,26 +1,78 @@
-import json
+"""Allure attachment helpers that do no work unless a report is being written."""
 
-import allure
+import orjson
 
+from tests.utils.bundles import read_bundle
 
-def attach_payload(payload):
+# Set by pytest_configure in tests/conftest.py when allure-pytest has a results
+# directory (--alluredir). Without one every attachment is discarded, so the
+# helpers below skip the serialization and file reads entirely. allure is
+# imported only past that check, so runs without a report never load it.
+ALLURE_ACTIVE = False
+
+# Attachments requested by the running test. They are only serialized and
+# attached by flush_attachments when the test fails; passing tests drop them.
+_pending = []
+
+
+def _attach_payload(payload):
+    import allure
+
+    # Compact JSON is much cheaper to produce; Allure's viewer formats it
     allure.attach(
-        json.dumps(payload, indent=2),
+        orjson.dumps(payload),
         name="Input Payload",
         attachment_type=allure.attachment_type.JSON,
     )
 
 
-def attach_bundle_yaml(path):
-    with open(path, "r", encoding="utf-8") as file:
-        content = file.read()
+def _attach_json(data, name):
+    import allure
+
+    allure.attach(orjson.dumps(data), name=name, attachment_type=allure.attachment_type.JSON)
+
+
+def _attach_bundle_yaml(path):
+    import allure
+
     allure.attach(
-        content,
+        read_bundle(path),
         name="YAML Bundle",
         attachment_type=allure.attachment_type.YAML,
     )
 
 
-def attach_output(output, name="mpe Output"):
+def _attach_output(output, name):
+    import allure
+
     allure.attach(output, name=name, attachment_type=allure.attachment_type.TEXT)
 
+
+def attach_payload(payload):
+    if ALLURE_ACTIVE:
+        _pending.append((_attach_payload, (payload,)))
+
+
+def attach_json(data, name):
+    if ALLURE_ACTIVE:
+        _pending.append((_attach_json, (data, name)))
+
+
+def attach_bundle_yaml(path):
+    if ALLURE_ACTIVE:
+        _pending.append((_attach_bundle_yaml, (path,)))
+
+
+def attach_output(output, name="mpe Output"):
+    if ALLURE_ACTIVE:
+        _pending.append((_attach_output, (output, name)))
+
+
+def flush_attachments(failed):
+    """Attach the pending items if the test failed, then forget them."""
+    try:
+        if failed:
+            for attach, args in _pending:
+                attach(*args)
+    finally:
+        _pending.clear()
@@ -0,0 +1,16 @@
+"""Cached access to PolicyDomain bundle files."""
+
+import functools
+import os
+
+
+@functools.lru_cache(maxsize=None)
+def _read_bundle(path, mtime_ns):
+    with open(path, "r", encoding="utf-8") as file:
+        return file.read()
+
+
+def read_bundle(path):
+    """Return the bundle's text, re-reading the file only when its mtime changes."""
+    path = str(path)
+    return _read_bundle(path, os.stat(path).st_mtime_ns)
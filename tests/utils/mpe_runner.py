@@ -1,12 +1,39 @@
-import json
+import contextlib
+import functools
+import os
+import queue
+import signal
+import socket
 import subprocess
+import threading
+import time
 from pathlib import Path
 
-import allure
+import orjson
 import pytest
+import requests
 
+from tests.utils.allure_helpers import attach_output
 
+
+# Printed on stdout by `mpe serve` once its HTTP listener is bound
+SERVER_READY_LINE = b"http server started on"
+
+# `mpe serve` listens on every interface; connecting to the IPv4 loopback
+# directly skips resolving "localhost" and any failed ::1 attempt first.
+SERVER_HOST = "127.0.0.1"
+
+# Cap on the stderr and non-record stdout kept from each mpe server. A bundle
+# that fails to compile can emit large diagnostics, which are replayed for
+# every payload and attached to every failing test.
+MAX_OUTPUT_BYTES = 1024 * 1024
+TRUNCATED_MARKER = b"\n[truncated]\n"
+
+
+@functools.cache
 def _resolve_mpe_binary():
+    # Resolved once per process: the mpe_binary fixture builds target/mpe
+    # before any server starts, so the path cannot change during a run.
     # Go up 2 levels: tests/utils/mpe_runner.py -> tests/ -> project_root
     project_root = Path(__file__).resolve().parents[2]
     local_binary = project_root / "target" / "mpe"
@@ -17,40 +44,231 @@ def _resolve_mpe_binary():
     return "mpe"
 
 
-def run_mpe_decision(payload, bundle_path, allow_error=False):
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind((SERVER_HOST, 0))
+        return sock.getsockname()[1]
+
+
+class _BoundedBuffer:
+    """Collects output lines up to a byte limit and marks anything dropped after it."""
+
+    def __init__(self, limit=MAX_OUTPUT_BYTES):
+        self._chunks = []
+        self._remaining = limit
+        self._truncated = False
+
+    def append(self, line):
+        if len(line) > self._remaining:
+            line = line[:self._remaining]
+            self._truncated = True
+        self._chunks.append(line)
+        self._remaining -= len(line)
+
+    def getvalue(self):
+        data = b"".join(self._chunks)
+        return data + TRUNCATED_MARKER if self._truncated else data
+
+
+class MpeServer:
+    """
+    A long-lived `mpe serve` process bound to a single PolicyDomain bundle.
+
+    The server writes one access record per decision to stdout, which is the
+    same JSON that `mpe test decision` prints, so decisions served over HTTP
+    can be asserted exactly like the one-shot CLI output. A bundle that fails
+    to compile makes the server exit at startup; that failure is captured
+    once and replayed for every decision.
+    """
+
+    def __init__(self, bundle_path, startup_timeout=15.0, session=None):
+        self.bundle_path = Path(bundle_path)
+        self.port = _free_port()
+        self.url = f"http://{SERVER_HOST}:{self.port}"
+        self.args = [
+            _resolve_mpe_binary(),
+            "serve",
+            "--bundle", str(self.bundle_path),
+            "--port", str(self.port),
+        ]
+        self.startup_failure = None
+
+        # Reused for every decision so all requests share one keep-alive connection;
+        # a session passed in by the caller is shared and left open on stop()
+        self._owns_session = session is None
+        self._session = requests.Session() if session is None else session
+        self._ready = threading.Event()
+        self._records = queue.Queue()
+        self._stdout_lines = _BoundedBuffer()
+        self._stderr_lines = _BoundedBuffer()
+        self.process = subprocess.Popen(
+            self.args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+        )
+        self._readers = [
+            threading.Thread(target=self._read_stdout, daemon=True),
+            threading.Thread(target=self._read_stderr, daemon=True),
+        ]
+        for reader in self._readers:
+            reader.start()
+
+        self._wait_until_ready(startup_timeout)
+
+    def _read_stdout(self):
+        for line in self.process.stdout:
+            if line.lstrip().startswith(b"{"):
+                self._records.put(line)
+            else:
+                self._stdout_lines.append(line)
+                if SERVER_READY_LINE in line:
+                    self._ready.set()
+
+    def _read_stderr(self):
+        for line in self.process.stderr:
+            self._stderr_lines.append(line)
+
+    def _wait_until_ready(self, timeout):
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                for reader in self._readers:
+                    reader.join()
+                self.startup_failure = subprocess.CompletedProcess(
+                    self.args,
+                    self.process.returncode,
+                    self._stdout_lines.getvalue(),
+                    self._stderr_lines.getvalue(),
+                )
+                return
+            # Wake as soon as the startup banner appears, otherwise back off
+            # geometrically and probe the port directly.
+            if self._ready.wait(timeout=min(0.01 * 2 ** attempt, 0.5)):
+                return
+            try:
+                socket.create_connection((SERVER_HOST, self.port), timeout=0.5).close()
+                return
+            except OSError:
+                attempt += 1
+
+        self.stop()
+        raise RuntimeError(f"MPE server for {self.bundle_path} failed to start within {timeout}s")
+
+    def decide(self, payload, timeout=10.0):
+        if self.startup_failure is not None:
+            return self.startup_failure
+
+        # Records are paired with requests by arrival order, so drop any left
+        # behind by an earlier decision that timed out before reading its own.
+        while not self._records.empty():
+            self._records.get_nowait()
+
+        # Transport and HTTP errors are decision failures like a non-zero mpe
+        # exit, so callers passing allow_error=True can assert on them.
+        try:
+            response = self._session.post(
+                f"{self.url}/decision",
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=timeout,
+            )
+            response.raise_for_status()
+        except requests.RequestException as error:
+            return subprocess.CompletedProcess(
+                self.args, 1, b"", f"Decision request to {self.url} failed: {error}".encode()
+            )
+        try:
+            record = self._records.get(timeout=timeout)
+        except queue.Empty:
+            return subprocess.CompletedProcess(
+                self.args, 1, b"", f"No access record received from {self.url} within {timeout}s".encode()
+            )
+        return subprocess.CompletedProcess(self.args, 0, record, b"")
+
+    def stop(self):
+        if self._owns_session:
+            self._session.close()
+        if self.process.poll() is not None:
+            return
+
+        # The server holds no state worth flushing, so CI can skip SIGTERM and
+        # kill the whole process group immediately with MPE_FAST_TEARDOWN=1.
+        if os.getenv("MPE_FAST_TEARDOWN") != "1":
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+                return
+            except subprocess.TimeoutExpired:
+                pass
+        # The server may exit on its own between poll() and here
+        with contextlib.suppress(ProcessLookupError):
+            os.killpg(self.process.pid, signal.SIGKILL)
+        self.process.wait()
+
+
+class MpeServerPool(dict):
+    """
+    Maps bundle paths to servers, starting each one lazily on first lookup.
+
+    A bundle whose server fails to start maps to None.
+    """
+
+    def __init__(self, session=None):
+        super().__init__()
+        self.session = session
+
+    def __missing__(self, bundle_path):
+        try:
+            server = MpeServer(bundle_path, session=self.session)
+        except (OSError, RuntimeError):
+            # The server could not be brought up; None makes run_mpe_decision
+            # fall back to one-shot `mpe test decision` runs for this bundle.
+            server = None
+        self[bundle_path] = server
+        return server
+
+    def stop_all(self):
+        for server in self.values():
+            if server is not None:
+                server.stop()
+        self.clear()
+
+
+def run_mpe_decision(payload, bundle_path, allow_error=False, server=None):
+    if server is not None:
+        result = server.decide(payload)
+        if not allow_error:
+            result.check_returncode()
+        return result
+
     result = subprocess.run(
         [_resolve_mpe_binary(), "test", "decision", "--bundle", str(bundle_path)],
-        input=json.dumps(payload),
-        text=True,
+        input=orjson.dumps(payload),
         capture_output=True,
         check=not allow_error,
     )
     return result
 
 
+_ALIASES = {
+    "ALLOW": "GRANT",
+    "PERMIT": "GRANT",
+    "DENY": "DENY",
+    "REJECT": "DENY",
+}
+
+
 def normalize_decision(value):
     if value is None:
         return ""
-    normalized = str(value).strip().upper()
-    aliases = {
-        "ALLOW": "GRANT",
-        "PERMIT": "GRANT",
-        "DENY": "DENY",
-        "REJECT": "DENY",
-    }
-    return aliases.get(normalized, normalized)
+    normalized = value if isinstance(value, str) else str(value)
+    normalized = normalized.strip().upper()
+    return _ALIASES.get(normalized, normalized)
 
 
 def handle_mpe_failure(result):
-    allure.attach(
-        result.stdout or "",
-        name="stdout",
-        attachment_type=allure.attachment_type.JSON,
-    )
-    allure.attach(
-        result.stderr or "",
-        name="stderr",
-        attachment_type=allure.attachment_type.JSON,
-    )
-    pytest.fail(f"`mpe` command failed:\n{result.stderr}")
-
+    attach_output(result.stdout or b"", name="stdout")
+    attach_output(result.stderr or b"", name="stderr")
+    pytest.fail(f"`mpe` command failed:\n{result.stderr.decode(errors='replace')}")